@@ -1,6 +1,6 @@
 """Core package for MTG Commander Sim."""
 
-from .models import Card, Deck
+from .models import Card, CardType, Deck
 from .engine import GameState, GameEngine
 
-__all__ = ["Card", "Deck", "GameState", "GameEngine"]
+__all__ = ["Card", "CardType", "Deck", "GameState", "GameEngine"]
@@ -1,10 +1,12 @@
 """Scryfall API cache for reducing API calls."""
 
-import json
+import os
 import time
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 
 class ScryfallCache:
     """
@@ -34,16 +36,22 @@ class ScryfallCache:
         """Load cache index from disk."""
         if self.index_file.exists():
             try:
-                with open(self.index_file, 'r') as f:
-                    return json.load(f)
+                with open(self.index_file, 'rb') as f:
+                    return orjson.loads(f.read())
             except:
                 return {}
         return {}
     
     def _save_index(self):
         """Save cache index to disk."""
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        self._write_json(self.index_file, self.index)
+    
+    def _write_json(self, path: Path, data):
+        """Write JSON atomically (temp file + rename), so readers never see a partial file."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
     
     def _get_cache_key(self, card_name: str) -> str:
         """Generate cache key from card name."""
@@ -88,8 +96,8 @@ class ScryfallCache:
             return None
         
         try:
-            with open(cache_file, 'r') as f:
-                return json.load(f)
+            with open(cache_file, 'rb') as f:
+                return orjson.loads(f.read())
         except:
             return None
     
@@ -101,12 +109,16 @@ class ScryfallCache:
             card_name: Name of the card
             card_data: Scryfall card data
         """
+        self._store(card_name, card_data)
+        self._save_index()
+    
+    def _store(self, card_name: str, card_data: dict):
+        """Write a card file and update the in-memory index (index is not saved)."""
         key = self._get_cache_key(card_name)
         
         # Save to file
         cache_file = self.cache_dir / f"{key}.json"
-        with open(cache_file, 'w') as f:
-            json.dump(card_data, f, indent=2)
+        self._write_json(cache_file, card_data)
         
         # Update index
         self.index[key] = {
@@ -114,6 +126,50 @@ class ScryfallCache:
             "timestamp": time.time(),
             "file": f"{key}.json"
         }
+    
+    def get_many(self, card_names: list[str]) -> dict[str, dict]:
+        """
+        Get cached data for several cards in one pass.
+        
+        Misses and expired entries are resolved from the in-memory index without
+        touching disk. Expired entries count as misses; purging them is left to
+        clear_expired().
+        
+        Args:
+            card_names: Names of the cards
+        
+        Returns:
+            Dictionary of card name -> cached card data (hits only)
+        """
+        found: dict[str, dict] = {}
+        
+        for card_name in card_names:
+            key = self._get_cache_key(card_name)
+            entry = self.index.get(key)
+            if entry is None or self._is_expired(entry["timestamp"]):
+                continue
+            
+            cache_file = self.cache_dir / f"{key}.json"
+            try:
+                with open(cache_file, 'rb') as f:
+                    found[card_name] = orjson.loads(f.read())
+            except (OSError, ValueError):
+                continue
+        
+        return found
+    
+    def put_many(self, cards: dict[str, dict]):
+        """
+        Store several cards, saving the index once instead of once per card.
+        
+        Args:
+            cards: Dictionary of card name -> Scryfall card data
+        """
+        if not cards:
+            return
+        
+        for card_name, card_data in cards.items():
+            self._store(card_name, card_data)
         self._save_index()
     
     def clear_expired(self):
@@ -1,6 +1,8 @@
 """Game engine for Goldfish simulation (solo playtesting)."""
 
+import json
 import random
+from datetime import datetime
 from typing import Optional
 from .models import Card
 
@@ -236,19 +238,15 @@ class GameEngine:
                     commander = card
                     break
         
-        # Remove commander from deck if found
-        library = [c for c in deck if c != commander]
-        
-        # If still no commander, just use all cards as library
-        if commander is None and deck:
-            library = deck
+        # Remove commander from deck if found (if still no commander, all cards are used)
+        # Each game gets its own Card instances: the deck may share one instance per
+        # unique card, while the engine tracks tapped state by id() and mutates tags.
+        library = [c.copy() for c in deck if c != commander]
         
         self.state.commander = commander
         self.state.library = library.copy()
         
         # Shuffle library
-        import random
-        import time
         # Ensure true randomness (default is system time, but being explicit helps)
         random.seed(None) 
         random.shuffle(self.state.library)
@@ -580,12 +578,11 @@ class GameEngine:
                 # (Engine checks cards_played_this_turn. If it has TAPPED_ENTRY tag, it's tapped.
                 # If basic land doesn't have tag, it might seem untapped?)
                 # We need to track that it entered tapped. 
-                # Simplest: Add TAPPED_ENTRY tag to the *instance* (Card is Pydantic, mutable in our flow).
+                # Simplest: Add TAPPED_ENTRY tag to the *instance* (Card is a mutable dataclass in our flow).
                 if "TAPPED_ENTRY" not in target_land.tags:
                     target_land.tags.append("TAPPED_ENTRY")
                 
                 # 4. Shuffle
-                import random
                 # random.seed(None) # Already reset at start
                 random.shuffle(self.state.library)
                 
@@ -711,7 +708,6 @@ class GameEngine:
                  pass
             
             # Shuffle
-            import random
             random.shuffle(self.state.library)
             
             # Log
@@ -762,9 +758,6 @@ class GameEngine:
         Args:
             filepath: Path to save JSON file
         """
-        import json
-        from datetime import datetime
-        
         log_data = {
             "metadata": {
                 "timestamp": datetime.now().isoformat(),
@@ -1,104 +1,174 @@
 """Core data models for MTG Commander Sim."""
 
-from typing import Optional
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import Iterator, Optional
 from pydantic import BaseModel, Field, computed_field, field_validator
 
 
-class Card(BaseModel):
-    """Represents a Magic: The Gathering card with tag-based abstraction."""
+class CardType:
+    """Bit flags for Card.type_mask (plain ints, cheap to AND in hot loops)."""
+    ARTIFACT = 1
+    CREATURE = 2
+    ENCHANTMENT = 4
+    INSTANT = 8
+    SORCERY = 16
+    LAND = 32
+    PLANESWALKER = 64
+
+
+_CARD_TYPE_RE = re.compile(r"Artifact|Creature|Enchantment|Instant|Sorcery|Land|Planeswalker")
+_CARD_TYPE_BITS: dict[str, int] = {
+    "Artifact": CardType.ARTIFACT,
+    "Creature": CardType.CREATURE,
+    "Enchantment": CardType.ENCHANTMENT,
+    "Instant": CardType.INSTANT,
+    "Sorcery": CardType.SORCERY,
+    "Land": CardType.LAND,
+    "Planeswalker": CardType.PLANESWALKER,
+}
+
+
+@lru_cache(maxsize=1024)
+def card_type_mask(type_line: str) -> int:
+    """Compute the CardType bitmask for a type line in one regex pass (memoized)."""
+    mask = 0
+    for type_name in _CARD_TYPE_RE.findall(type_line):
+        mask |= _CARD_TYPE_BITS[type_name]
+    return mask
+
+
+@dataclass(slots=True, kw_only=True)
+class Card:
+    """
+    Represents a Magic: The Gathering card with tag-based abstraction.
+    
+    Plain slotted dataclass instead of a Pydantic model: card data comes from
+    the (trusted) Scryfall API, so per-instance validation is pure overhead.
+    """
     
     name: str
-    mana_cost: dict[str, int] = Field(
-        default_factory=dict,
-        description="Parsed mana cost, e.g., {'R': 1, 'G': 1, 'colorless': 2}"
-    )
-    cmc: int = Field(ge=0, description="Converted Mana Cost (total)")
-    type_line: str = Field(description="e.g., 'Creature — Human Wizard'")
-    oracle_text: str = Field(default="", description="Card rules text")
-    tags: list[str] = Field(
-        default_factory=list,
-        description="Functional tags like ['RAMP', 'ARTIFACT']"
-    )
-    scryfall_id: str = Field(description="Scryfall UUID")
-    color_identity: list[str] = Field(
-        default_factory=list,
-        description="Color identity for Commander format (e.g., ['R', 'G'])"
-    )
+    # Parsed mana cost, e.g., {'R': 1, 'G': 1, 'colorless': 2}
+    mana_cost: dict[str, int] = field(default_factory=dict)
+    # Converted Mana Cost (total)
+    cmc: int
+    # e.g., 'Creature — Human Wizard'
+    type_line: str
+    # Card rules text
+    oracle_text: str = ""
+    # Functional tags like ['RAMP', 'ARTIFACT']
+    tags: list[str] = field(default_factory=list)
+    # Scryfall UUID
+    scryfall_id: str
+    # Color identity for Commander format (e.g., ['R', 'G'])
+    color_identity: list[str] = field(default_factory=list)
     
-    @computed_field
-    @property
-    def is_land(self) -> bool:
-        """Check if this card is a land based on type line."""
-        return "Land" in self.type_line
+    # Derived from type_line once at construction (see __post_init__)
+    type_mask: int = field(init=False)
+    is_land: bool = field(init=False)
+    is_permanent: bool = field(init=False)
     
-    @property
-    def is_permanent(self) -> bool:
+    def __post_init__(self):
         """
-        Check if this card is a permanent.
+        Precompute type checks so hot paths read plain attributes.
         
         Permanents: Artifact, Creature, Enchantment, Planeswalker, Land
-        Non-Permanents: Instant, Sorcery
+        Non-Permanents: Instant, Sorcery (go to graveyard after casting)
+        """
+        mask = card_type_mask(self.type_line)
+        self.type_mask = mask
+        self.is_land = bool(mask & CardType.LAND)
+        self.is_permanent = not (mask & (CardType.INSTANT | CardType.SORCERY))
+    
+    def copy(self) -> "Card":
         """
-        # Instants and Sorceries are NOT permanents (go to graveyard after casting)
-        if "Instant" in self.type_line or "Sorcery" in self.type_line:
-            return False
+        Create an independent instance of this card.
         
-        # Everything else (Artifact, Creature, Enchantment, Planeswalker, Land) is permanent
-        return True
+        Scalar fields are shared; only the mutable containers (tags, mana_cost,
+        color_identity) are shallow-copied, which is all the engine ever mutates.
+        Much cheaper than a deep copy.
+        """
+        return Card(
+            name=self.name,
+            mana_cost=dict(self.mana_cost),
+            cmc=self.cmc,
+            type_line=self.type_line,
+            oracle_text=self.oracle_text,
+            tags=list(self.tags),
+            scryfall_id=self.scryfall_id,
+            color_identity=list(self.color_identity),
+        )
     
     def __str__(self) -> str:
         """Pretty string representation."""
         tags_str = ", ".join(self.tags) if self.tags else "No tags"
         return f"{self.name} (CMC: {self.cmc}) [{tags_str}]"
-    
-    class Config:
-        """Pydantic config."""
-        frozen = False
-        extra = "ignore"
 
 
 class Deck(BaseModel):
     """Represents a Commander deck (100 cards total: 1 commander + 99 main deck)."""
     
     commander: Card
-    cards: list[Card] = Field(description="Main deck (should be 99 cards)")
+    cards: tuple[Card, ...] = Field(description="Main deck (should be 99 cards)")
     
     @field_validator("cards")
     @classmethod
-    def validate_deck_size(cls, v: list[Card], info) -> list[Card]:
+    def validate_deck_size(cls, v: tuple[Card, ...], info) -> tuple[Card, ...]:
         """Ensure deck has exactly 99 cards (excluding commander)."""
         if len(v) != 99:
             raise ValueError(f"Deck must have exactly 99 cards, got {len(v)}")
         return v
     
     @computed_field
-    @property
+    @cached_property
     def all_cards(self) -> list[Card]:
         """Get all 100 cards (commander + deck)."""
-        return [self.commander] + self.cards
+        return [self.commander, *self.cards]
+    
+    def iter_cards(self) -> Iterator[Card]:
+        """Iterate all 100 cards (commander + deck) without building a list."""
+        return chain((self.commander,), self.cards)
+    
+    @cached_property
+    def _stats(self) -> tuple[int, int, int]:
+        """Single pass over all cards: (land count, non-land count, non-land CMC sum)."""
+        land_count = 0
+        non_land_count = 0
+        non_land_cmc = 0
+        for card in self.iter_cards():
+            if card.is_land:
+                land_count += 1
+            else:
+                non_land_count += 1
+                non_land_cmc += card.cmc
+        return land_count, non_land_count, non_land_cmc
     
     @computed_field
-    @property
+    @cached_property
     def land_count(self) -> int:
         """Count lands in the deck."""
-        return sum(1 for card in self.all_cards if card.is_land)
+        return self._stats[0]
     
     @computed_field
-    @property
+    @cached_property
     def avg_cmc(self) -> float:
         """Calculate average converted mana cost (excluding lands)."""
-        non_lands = [card for card in self.all_cards if not card.is_land]
-        if not non_lands:
+        _, non_land_count, non_land_cmc = self._stats
+        if not non_land_count:
             return 0.0
-        return sum(card.cmc for card in non_lands) / len(non_lands)
+        return non_land_cmc / non_land_count
+    
+    @cached_property
+    def _tag_distribution(self) -> Counter[str]:
+        """Tag counts across all cards (computed once per deck)."""
+        return Counter(chain.from_iterable(card.tags for card in self.iter_cards()))
     
     def get_tag_distribution(self) -> dict[str, int]:
         """Get distribution of tags across all cards."""
-        tag_counts: dict[str, int] = {}
-        for card in self.all_cards:
-            for tag in card.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        return tag_counts
+        return dict(self._tag_distribution)
     
     def __str__(self) -> str:
         """Pretty string representation."""
@@ -111,4 +181,6 @@ class Deck(BaseModel):
     
     class Config:
         """Pydantic config."""
-        frozen = False
+        # Frozen (and cards is a tuple) so the cached aggregates above can
+        # never go stale
+        frozen = True
@@ -1,20 +1,41 @@
 """Scryfall API client for fetching card data."""
 
 import asyncio
+import logging
 import re
+from functools import partial
 from typing import Optional
 import httpx
+import orjson
 
+from .cache import ScryfallCache
 from .models import Card
 from .tags import assign_tags
 
 
+logger = logging.getLogger(__name__)
+
 # Scryfall API base URL
 SCRYFALL_API_BASE = "https://api.scryfall.com"
 
 # Rate limiting: Scryfall requests 50-100ms between requests
 RATE_LIMIT_DELAY = 0.1  # 100ms
 
+# Variable mana symbols, all counted as "X"
+_VARIABLE_SYMBOLS = frozenset({"X", "Y", "Z"})
+
+# Max requests in flight at once. Request *starts* are still spaced by
+# RATE_LIMIT_DELAY, so this overlaps latency without exceeding ~10 req/s.
+MAX_CONCURRENT_REQUESTS = 8
+
+# /cards/collection accepts at most 75 identifiers per request
+COLLECTION_BATCH_SIZE = 75
+
+# Precompiled decklist patterns
+_QTY_RE = re.compile(r"^\d+x?\s+")
+_SETCODE_RE = re.compile(r"\s*\([^)]+\)\s*$")
+_DECKLINE_RE = re.compile(r"^(\d+)x?\s+(.+)$")
+
 
 def parse_mana_cost(mana_cost_str: str) -> dict[str, int]:
     """
@@ -31,27 +52,39 @@ def parse_mana_cost(mana_cost_str: str) -> dict[str, int]:
     if not mana_cost_str:
         return {}
     
-    # Extract all mana symbols from {X} format
-    symbols = re.findall(r"\{([^}]+)\}", mana_cost_str)
-    
     mana_dict: dict[str, int] = {}
     
-    for symbol in symbols:
+    # Single manual scan over the {X} symbols (no regex, no intermediate list)
+    i = 0
+    n = len(mana_cost_str)
+    while i < n:
+        if mana_cost_str[i] != "{":
+            i += 1
+            continue
+        
+        end = mana_cost_str.find("}", i + 1)
+        if end == -1:
+            break
+        symbol = mana_cost_str[i + 1:end]
+        i = end + 1
+        
+        if not symbol:
+            continue
         # Handle generic/colorless mana (numbers)
         if symbol.isdigit():
             colorless = int(symbol)
             mana_dict["colorless"] = mana_dict.get("colorless", 0) + colorless
+        # Handle Phyrexian mana like {R/P} (must be checked before generic hybrid)
+        elif "/P" in symbol:
+            color = symbol.split("/")[0]
+            mana_dict[color] = mana_dict.get(color, 0) + 1
         # Handle hybrid mana like {R/G}
         elif "/" in symbol:
             # For simplicity, count hybrid as first color
             color = symbol.split("/")[0]
             mana_dict[color] = mana_dict.get(color, 0) + 1
-        # Handle Phyrexian mana like {R/P}
-        elif "/P" in symbol:
-            color = symbol.split("/")[0]
-            mana_dict[color] = mana_dict.get(color, 0) + 1
         # Handle X, Y, Z
-        elif symbol in ["X", "Y", "Z"]:
+        elif symbol in _VARIABLE_SYMBOLS:
             mana_dict["X"] = mana_dict.get("X", 0) + 1
         # Standard color symbols (W, U, B, R, G, C)
         else:
@@ -81,10 +114,10 @@ def parse_card_name(line: str) -> Optional[str]:
     
     # Remove quantity prefix (e.g., "1 ", "3x ", "1x ")
     # Matches: "1 Sol Ring", "3x Forest", "1x Command Tower"
-    line = re.sub(r"^\d+x?\s+", "", line)
+    line = _QTY_RE.sub("", line)
     
     # Remove set codes in parentheses (e.g., "Sol Ring (CMD)")
-    line = re.sub(r"\s*\([^)]+\)\s*$", "", line)
+    line = _SETCODE_RE.sub("", line)
     
     return line.strip() if line.strip() else None
 
@@ -94,7 +127,7 @@ async def fetch_card_from_scryfall(
     client: httpx.AsyncClient,
     retry_count: int = 0,
     max_retries: int = 5,
-    cache: Optional['ScryfallCache'] = None
+    cache: Optional[ScryfallCache] = None
 ) -> Optional[dict]:
     """
     Fetch a single card from Scryfall API by name with exponential backoff.
@@ -127,42 +160,118 @@ async def fetch_card_from_scryfall(
         response = await client.get(url, params=params)
         
         if response.status_code == 200:
-            card_data = response.json()
+            card_data = orjson.loads(response.content)
             # Cache successful response
             if cache:
                 cache.put(card_name, card_data)
             return card_data
         
         elif response.status_code == 404:
-            print(f"⚠️  Card not found: {card_name}")
+            logger.debug("Card not found: %s", card_name)
             return None
         
         elif response.status_code == 429:
             # Rate limited! Implement exponential backoff
             if retry_count >= max_retries:
-                print(f"❌ Rate limit exceeded after {max_retries} retries for: {card_name}")
+                logger.error("❌ Rate limit exceeded after %d retries for: %s", max_retries, card_name)
                 return None
             
             # Exponential backoff: 2^retry * base_delay
             # Retry 1: 2s, Retry 2: 4s, Retry 3: 8s, Retry 4: 16s, Retry 5: 32s
             backoff_delay = (2 ** retry_count) * 1.0
             
-            print(f"⚠️  Rate limited (HTTP 429)! Waiting {backoff_delay:.1f}s before retry {retry_count + 1}/{max_retries}...")
+            logger.warning("⚠️  Rate limited (HTTP 429)! Waiting %.1fs before retry %d/%d...", backoff_delay, retry_count + 1, max_retries)
             await asyncio.sleep(backoff_delay)
             
             # Recursive retry
             return await fetch_card_from_scryfall(card_name, client, retry_count + 1, max_retries, cache)
         
         else:
-            print(f"⚠️  Error fetching {card_name}: HTTP {response.status_code}")
+            logger.warning("⚠️  Error fetching %s: HTTP %d", card_name, response.status_code)
             return None
     
     except Exception as e:
-        print(f"⚠️  Exception fetching {card_name}: {e}")
+        logger.warning("⚠️  Exception fetching %s: %s", card_name, e)
         return None
 
 
 
+async def fetch_collection_from_scryfall(
+    card_names: list[str],
+    client: httpx.AsyncClient,
+    retry_count: int = 0,
+    max_retries: int = 5,
+) -> list[dict]:
+    """
+    Fetch a batch of cards (max 75) in a single request via /cards/collection.
+    
+    The collection endpoint only matches exact names (case-insensitive), so
+    callers should fall back to fetch_card_from_scryfall (fuzzy search) for
+    names missing from the result. Same exponential backoff on HTTP 429 as
+    fetch_card_from_scryfall.
+    
+    Args:
+        card_names: Names of the cards to fetch (at most COLLECTION_BATCH_SIZE)
+        client: httpx AsyncClient instance
+        retry_count: Current retry attempt (internal use)
+        max_retries: Maximum number of retries for rate limiting
+    
+    Returns:
+        List of Scryfall card data dicts for the names that were found
+    """
+    if not card_names:
+        return []
+    
+    url = f"{SCRYFALL_API_BASE}/cards/collection"
+    payload = {"identifiers": [{"name": name} for name in card_names]}
+    
+    try:
+        response = await client.post(url, json=payload)
+        
+        if response.status_code == 200:
+            return orjson.loads(response.content).get("data", [])
+        
+        elif response.status_code == 429:
+            if retry_count >= max_retries:
+                logger.error("❌ Rate limit exceeded after %d retries for batch of %d cards", max_retries, len(card_names))
+                return []
+            
+            backoff_delay = (2 ** retry_count) * 1.0
+            
+            logger.warning("⚠️  Rate limited (HTTP 429)! Waiting %.1fs before retry %d/%d...", backoff_delay, retry_count + 1, max_retries)
+            await asyncio.sleep(backoff_delay)
+            
+            return await fetch_collection_from_scryfall(card_names, client, retry_count + 1, max_retries)
+        
+        else:
+            logger.warning("⚠️  Error fetching batch of %d cards: HTTP %d", len(card_names), response.status_code)
+            return []
+    
+    except Exception as e:
+        logger.warning("⚠️  Exception fetching batch of %d cards: %s", len(card_names), e)
+        return []
+
+
+def _match_collection_results(card_names: list[str], found: list[dict]) -> dict[str, dict]:
+    """
+    Map requested card names to the card data returned by /cards/collection.
+    
+    Matches case-insensitively on the full name and, for double-faced cards,
+    on the front face name ("Front // Back" can be requested as "Front").
+    """
+    by_name: dict[str, dict] = {}
+    for card_data in found:
+        full_name = card_data.get("name", "").lower()
+        by_name.setdefault(full_name, card_data)
+        by_name.setdefault(full_name.split(" // ")[0], card_data)
+    
+    return {
+        name: by_name[name.lower()]
+        for name in card_names
+        if name.lower() in by_name
+    }
+
+
 def create_card_from_scryfall_data(card_data: dict) -> Card:
     """
     Create a Card object from Scryfall API response.
@@ -206,7 +315,9 @@ async def fetch_cards(card_names: list[str], use_cache: bool = True) -> list[Car
     This is the main entry point for card fetching. It handles:
     - Parsing card names from various formats (plain, with quantities, etc.)
     - Caching (24h TTL) to reduce API calls
-    - Rate limiting (100ms between requests)
+    - Batched lookups (75 cards per request via /cards/collection),
+      with a fuzzy per-card fallback for names that don't match exactly
+    - Concurrent requests (bounded), rate limited to one start per 100ms
     - Exponential backoff on HTTP 429 (rate limiting)
     - Error handling for missing cards
     - Automatic tagging
@@ -218,8 +329,6 @@ async def fetch_cards(card_names: list[str], use_cache: bool = True) -> list[Car
     Returns:
         List of Card objects (may be shorter than input if some cards not found)
     """
-    from .cache import ScryfallCache
-    
     cards: list[Card] = []
     
     # Initialize cache
@@ -229,7 +338,7 @@ async def fetch_cards(card_names: list[str], use_cache: bool = True) -> list[Car
         # Clear expired entries
         expired = cache.clear_expired()
         if expired > 0:
-            print(f"🧹 Cleared {expired} expired cache entries")
+            logger.info("🧹 Cleared %d expired cache entries", expired)
     
     # Parse and clean card names
     cleaned_names = []
@@ -242,27 +351,86 @@ async def fetch_cards(card_names: list[str], use_cache: bool = True) -> list[Car
     cache_hits = 0
     cache_misses = 0
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for i, card_name in enumerate(cleaned_names):
-            # Check if in cache (already checked in fetch_card_from_scryfall, but track stats)
-            if cache and cache.get(card_name):
-                cache_hits += 1
-            else:
-                cache_misses += 1
-            
-            # Rate limiting: wait between requests (only for cache misses)
-            if i > 0 and not (cache and cache.get(card_name)):
+    # Resolved Scryfall data per card name
+    card_data_by_name: dict[str, dict] = {}
+    uncached_names: list[str] = []
+    
+    # Exactly one cache lookup per unique name (deduplicated, order kept),
+    # resolved in a single batched pass over the cache index
+    unique_names = list(dict.fromkeys(cleaned_names))
+    cached_by_name = cache.get_many(unique_names) if cache else {}
+    
+    # Newly fetched entries, written to the cache in one batch at the end
+    new_cache_entries: dict[str, dict] = {}
+    
+    for card_name in unique_names:
+        cached_data = cached_by_name.get(card_name)
+        if cached_data:
+            cache_hits += 1
+            card_data_by_name[card_name] = cached_data
+        else:
+            cache_misses += 1
+            uncached_names.append(card_name)
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    rate_lock = asyncio.Lock()
+    
+    async def throttled(request):
+        """Run a request with bounded concurrency and rate-limited start times."""
+        async with semaphore:
+            async with rate_lock:
                 await asyncio.sleep(RATE_LIMIT_DELAY)
-            
-            card_data = await fetch_card_from_scryfall(card_name, client, cache=cache)
-            
+            return await request()
+    
+    limits = httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS)
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+        # 1. Batch exact-name lookups via /cards/collection (75 names per request)
+        batches = [
+            uncached_names[start:start + COLLECTION_BATCH_SIZE]
+            for start in range(0, len(uncached_names), COLLECTION_BATCH_SIZE)
+        ]
+        batch_results = await asyncio.gather(*(
+            throttled(partial(fetch_collection_from_scryfall, batch, client))
+            for batch in batches
+        ))
+        
+        for batch, found in zip(batches, batch_results):
+            for card_name, card_data in _match_collection_results(batch, found).items():
+                card_data_by_name[card_name] = card_data
+                new_cache_entries[card_name] = card_data
+        
+        # 2. Fuzzy fallback for names the collection endpoint couldn't match.
+        # These are known cache misses, so skip fetch_card_from_scryfall's own lookup.
+        fallback_names = [name for name in uncached_names if name not in card_data_by_name]
+        fallback_results = await asyncio.gather(*(
+            throttled(partial(fetch_card_from_scryfall, card_name, client))
+            for card_name in fallback_names
+        ))
+        
+        for card_name, card_data in zip(fallback_names, fallback_results):
             if card_data:
-                card = create_card_from_scryfall_data(card_data)
-                cards.append(card)
+                card_data_by_name[card_name] = card_data
+                new_cache_entries[card_name] = card_data
+    
+    if cache:
+        cache.put_many(new_cache_entries)
+    
+    # One warning for all missing cards instead of one line per card
+    not_found = [name for name in uncached_names if name not in card_data_by_name]
+    if not_found:
+        logger.warning("⚠️  Cards not found: %s", ", ".join(not_found))
+    
+    for card_name in cleaned_names:
+        card_data = card_data_by_name.get(card_name)
+        if card_data:
+            cards.append(create_card_from_scryfall_data(card_data))
     
     # Show cache stats
     if cache:
-        print(f"💾 Cache: {cache_hits} hits, {cache_misses} misses ({cache_hits/(cache_hits+cache_misses)*100:.1f}% hit rate)")
+        logger.info(
+            "💾 Cache: %d hits, %d misses (%.1f%% hit rate)",
+            cache_hits, cache_misses, cache_hits / (cache_hits + cache_misses) * 100,
+        )
     
     return cards
 
@@ -302,7 +470,7 @@ def parse_decklist(lines: list[str]) -> tuple[list[tuple[str, int]], Optional[st
         
         # Extract quantity (default 1)
         quantity = 1
-        match = re.match(r'^(\d+)x?\s+(.+)$', line)
+        match = _DECKLINE_RE.match(line)
         
         if match:
             quantity = int(match.group(1))
@@ -311,7 +479,7 @@ def parse_decklist(lines: list[str]) -> tuple[list[tuple[str, int]], Optional[st
             card_name = line
         
         # Clean card name (remove set codes, etc.)
-        card_name = re.sub(r'\s*\([^)]+\)\s*$', '', card_name).strip()
+        card_name = _SETCODE_RE.sub('', card_name).strip()
         
         if card_name:
             cards.append((card_name, quantity))
@@ -352,48 +520,46 @@ async def fetch_deck_from_decklist(
     if not card_quantities:
         return [], commander
     
-    # Get unique card names for Scryfall fetching (including commander if specified)
-    unique_names = list(set(name for name, _ in card_quantities))
-    if commander and commander not in unique_names:
-        unique_names.append(commander)
+    # Get unique card names for Scryfall fetching (including commander if specified).
+    # Deduplicated case-insensitively in decklist order: lowercase name -> first spelling seen
+    unique_names: dict[str, str] = {}
+    for name, _ in card_quantities:
+        unique_names.setdefault(name.lower(), name)
+    if commander:
+        unique_names.setdefault(commander.lower(), commander)
     
-    print(f"📝 Found {len(card_quantities)} entries, {len(unique_names)} unique cards")
+    logger.info("📝 Found %d entries, %d unique cards", len(card_quantities), len(unique_names))
     if commander:
-        print(f"👑 Commander: {commander}")
-    print(f"💾 Total cards in deck: {sum(qty for _, qty in card_quantities)}")
+        logger.info("👑 Commander: %s", commander)
+    logger.info("💾 Total cards in deck: %d", sum(qty for _, qty in card_quantities))
     
     # Fetch unique cards from Scryfall
-    fetched_cards = await fetch_cards(unique_names)
+    fetched_cards = await fetch_cards(list(unique_names.values()))
     
     # Create lookup dictionary for fetched cards
     card_lookup = {card.name.lower(): card for card in fetched_cards}
     
-    # Expand to full deck with duplicates, ensuring unique instances
+    # Expand to full deck with duplicates. Duplicates share one Card instance;
+    # GameEngine.start_game creates the per-game instances it mutates.
     full_deck: list[Card] = []
     missing_cards = []
-    import dataclasses # Not needed for Pydantic
     
     for card_name, quantity in card_quantities:
         # Normalize card_name for lookup, as Scryfall might return slightly different casing
         normalized_card_name = card_name.lower()
         
         if normalized_card_name in card_lookup:
-            card_obj = card_lookup[normalized_card_name]
-            for _ in range(quantity):
-                # CRITICAL: Create a NEW instance for each card to avoid shared state
-                # Since Card is a Pydantic Model (v2), use model_copy(deep=True)
-                new_instance = card_obj.model_copy(deep=True)
-                
-                full_deck.append(new_instance)
+            full_deck.extend([card_lookup[normalized_card_name]] * quantity)
         else:
             missing_cards.append(f"{quantity}x {card_name}")
     
     if missing_cards:
-        print(f"\n⚠️  Missing cards (not found on Scryfall):")
-        for missing in missing_cards:
-            print(f"   - {missing}")
+        logger.warning(
+            "⚠️  Missing cards (not found on Scryfall):\n%s",
+            "\n".join(f"   - {missing}" for missing in missing_cards),
+        )
             
     if len(full_deck) < 100:
-         print(f"⚠️  Note: Deck has {len(full_deck)} cards (Commander size usually 100). Check input list.")
+         logger.warning("⚠️  Note: Deck has %d cards (Commander size usually 100). Check input list.", len(full_deck))
     
     return full_deck, commander
@@ -1,11 +1,19 @@
 """Tagging system for categorizing card functionality."""
 
 import re
-from enum import Enum
+import sys
+from functools import lru_cache
 
+from .models import CardType, card_type_mask
 
-class CardTag(str, Enum):
-    """Tags for categorizing card functionality."""
+
+class CardTag:
+    """
+    Tags for categorizing card functionality.
+    
+    Plain (interned) string constants rather than an Enum, so card.tags holds
+    bare strings that compare cheaply against the engine's string literals.
+    """
     # Basic types
     LAND = "LAND"
     ARTIFACT = "ARTIFACT"
@@ -34,132 +42,152 @@ class CardTag(str, Enum):
 
 
 # Static mappings for well-known cards
-STATIC_CARD_TAGS: dict[str, list[str]] = {
+STATIC_CARD_TAGS: dict[str, tuple[str, ...]] = {
     # Mana rocks
-    "Sol Ring": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Arcane Signet": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Mana Crypt": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Mana Vault": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Chrome Mox": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Mox Diamond": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Fellwar Stone": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Thought Vessel": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Mind Stone": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Talisman of Dominance": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Talisman of Progress": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Talisman of Creativity": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Talisman of Conviction": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Talisman of Hierarchy": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Coldsteel Heart": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY],
-    "Fire Diamond": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY],
-    "Marble Diamond": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY],
-    "Sky Diamond": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY],
-    "Moss Diamond": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY],
-    "Charcoal Diamond": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY],
-    "Star Compass": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY],
-    "Prismatic Lens": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Thran Dynamo": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Hedron Archive": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
-    "Gilded Lotus": [CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK],
+    "Sol Ring": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Arcane Signet": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Mana Crypt": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Mana Vault": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Chrome Mox": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Mox Diamond": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Fellwar Stone": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Thought Vessel": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Mind Stone": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.DRAW),
+    "Talisman of Dominance": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Talisman of Progress": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Talisman of Creativity": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Talisman of Conviction": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Talisman of Hierarchy": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Coldsteel Heart": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY),
+    "Fire Diamond": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY),
+    "Marble Diamond": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY),
+    "Sky Diamond": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY),
+    "Moss Diamond": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY),
+    "Charcoal Diamond": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY),
+    "Star Compass": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.TAPPED_ENTRY),
+    "Prismatic Lens": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Thran Dynamo": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
+    "Hedron Archive": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK, CardTag.DRAW),
+    "Gilded Lotus": (CardTag.RAMP, CardTag.ARTIFACT, CardTag.MANA_ROCK),
     
     # Special lands
-    "Command Tower": [CardTag.LAND, CardTag.RAMP],
-    "Arcane Lighthouse": [CardTag.LAND],
-    "Reliquary Tower": [CardTag.LAND],
-    "Urborg, Tomb of Yawgmoth": [CardTag.LAND, CardTag.RAMP],
-    "Cabal Coffers": [CardTag.LAND, CardTag.RAMP],
+    "Command Tower": (CardTag.LAND, CardTag.RAMP),
+    "Arcane Lighthouse": (CardTag.LAND,),
+    "Reliquary Tower": (CardTag.LAND,),
+    "Urborg, Tomb of Yawgmoth": (CardTag.LAND, CardTag.RAMP),
+    "Cabal Coffers": (CardTag.LAND, CardTag.RAMP),
     
     # Ramp spells
-    "Rampant Growth": [CardTag.RAMP, CardTag.SORCERY],
-    "Cultivate": [CardTag.RAMP, CardTag.SORCERY],
-    "Kodama's Reach": [CardTag.RAMP, CardTag.SORCERY],
-    "Farseek": [CardTag.RAMP, CardTag.SORCERY],
-    "Nature's Lore": [CardTag.RAMP, CardTag.SORCERY],
-    "Three Visits": [CardTag.RAMP, CardTag.SORCERY],
-    "Skyshroud Claim": [CardTag.RAMP, CardTag.SORCERY],
+    "Rampant Growth": (CardTag.RAMP, CardTag.SORCERY, CardTag.RAMP_FETCH),
+    "Cultivate": (CardTag.RAMP, CardTag.SORCERY, CardTag.RAMP_FETCH),
+    "Kodama's Reach": (CardTag.RAMP, CardTag.SORCERY, CardTag.RAMP_FETCH),
+    "Farseek": (CardTag.RAMP, CardTag.SORCERY, CardTag.RAMP_FETCH),
+    "Nature's Lore": (CardTag.RAMP, CardTag.SORCERY, CardTag.RAMP_FETCH),
+    "Three Visits": (CardTag.RAMP, CardTag.SORCERY, CardTag.RAMP_FETCH),
+    "Skyshroud Claim": (CardTag.RAMP, CardTag.SORCERY, CardTag.RAMP_FETCH),
     
     # Ramp creatures
-    "Llanowar Elves": [CardTag.RAMP, CardTag.CREATURE],
-    "Arbor Elf": [CardTag.RAMP, CardTag.CREATURE],
-    "Birds of Paradise": [CardTag.RAMP, CardTag.CREATURE],
-    "Fyndhorn Elves": [CardTag.RAMP, CardTag.CREATURE],
-    "Sakura-Tribe Elder": [CardTag.RAMP, CardTag.CREATURE],
+    "Llanowar Elves": (CardTag.RAMP, CardTag.CREATURE, CardTag.MANA_ROCK),
+    "Arbor Elf": (CardTag.RAMP, CardTag.CREATURE),
+    "Birds of Paradise": (CardTag.RAMP, CardTag.CREATURE, CardTag.MANA_ROCK),
+    "Fyndhorn Elves": (CardTag.RAMP, CardTag.CREATURE, CardTag.MANA_ROCK),
+    "Sakura-Tribe Elder": (CardTag.RAMP, CardTag.CREATURE, CardTag.RAMP_FETCH),
     
     # Card draw
-    "Rhystic Study": [CardTag.DRAW, CardTag.ENCHANTMENT],
-    "Mystic Remora": [CardTag.DRAW, CardTag.ENCHANTMENT],
-    "Phyrexian Arena": [CardTag.DRAW, CardTag.ENCHANTMENT],
-    "Sylvan Library": [CardTag.DRAW, CardTag.ENCHANTMENT],
+    "Rhystic Study": (CardTag.DRAW, CardTag.ENCHANTMENT),
+    "Mystic Remora": (CardTag.DRAW, CardTag.ENCHANTMENT),
+    "Phyrexian Arena": (CardTag.DRAW, CardTag.ENCHANTMENT),
+    "Sylvan Library": (CardTag.DRAW, CardTag.ENCHANTMENT),
     
     # Removal
-    "Swords to Plowshares": [CardTag.REMOVAL, CardTag.INSTANT],
-    "Path to Exile": [CardTag.REMOVAL, CardTag.INSTANT],
-    "Assassin's Trophy": [CardTag.REMOVAL, CardTag.INSTANT],
-    "Beast Within": [CardTag.REMOVAL, CardTag.INSTANT],
-    "Chaos Warp": [CardTag.REMOVAL, CardTag.INSTANT],
-    "Generous Gift": [CardTag.REMOVAL, CardTag.INSTANT],
+    "Swords to Plowshares": (CardTag.REMOVAL, CardTag.INSTANT),
+    "Path to Exile": (CardTag.REMOVAL, CardTag.INSTANT),
+    "Assassin's Trophy": (CardTag.REMOVAL, CardTag.INSTANT),
+    "Beast Within": (CardTag.REMOVAL, CardTag.INSTANT),
+    "Chaos Warp": (CardTag.REMOVAL, CardTag.INSTANT),
+    "Generous Gift": (CardTag.REMOVAL, CardTag.INSTANT),
     
     # Board wipes
-    "Wrath of God": [CardTag.BOARD_WIPE, CardTag.SORCERY],
-    "Damnation": [CardTag.BOARD_WIPE, CardTag.SORCERY],
-    "Cyclonic Rift": [CardTag.BOARD_WIPE, CardTag.INSTANT],
-    "Blasphemous Act": [CardTag.BOARD_WIPE, CardTag.SORCERY],
+    "Wrath of God": (CardTag.BOARD_WIPE, CardTag.REMOVAL, CardTag.SORCERY),
+    "Damnation": (CardTag.BOARD_WIPE, CardTag.REMOVAL, CardTag.SORCERY),
+    "Cyclonic Rift": (CardTag.BOARD_WIPE, CardTag.INSTANT),
+    "Blasphemous Act": (CardTag.BOARD_WIPE, CardTag.SORCERY),
     
     # Counterspells
-    "Counterspell": [CardTag.COUNTERSPELL, CardTag.INSTANT],
-    "Swan Song": [CardTag.COUNTERSPELL, CardTag.INSTANT],
-    "Mana Drain": [CardTag.COUNTERSPELL, CardTag.INSTANT],
-    "Force of Will": [CardTag.COUNTERSPELL, CardTag.INSTANT],
-    "Pact of Negation": [CardTag.COUNTERSPELL, CardTag.INSTANT],
+    "Counterspell": (CardTag.COUNTERSPELL, CardTag.INSTANT),
+    "Swan Song": (CardTag.COUNTERSPELL, CardTag.INSTANT),
+    "Mana Drain": (CardTag.COUNTERSPELL, CardTag.INSTANT),
+    "Force of Will": (CardTag.COUNTERSPELL, CardTag.INSTANT),
+    "Pact of Negation": (CardTag.COUNTERSPELL, CardTag.INSTANT),
     
     # Tutors
-    "Demonic Tutor": [CardTag.TUTOR, CardTag.SORCERY],
-    "Vampiric Tutor": [CardTag.TUTOR, CardTag.INSTANT],
-    "Worldly Tutor": [CardTag.TUTOR, CardTag.INSTANT],
-    "Mystical Tutor": [CardTag.TUTOR, CardTag.INSTANT],
-    "Enlightened Tutor": [CardTag.TUTOR, CardTag.INSTANT],
+    "Demonic Tutor": (CardTag.TUTOR, CardTag.SORCERY),
+    "Vampiric Tutor": (CardTag.TUTOR, CardTag.INSTANT),
+    "Worldly Tutor": (CardTag.TUTOR, CardTag.INSTANT),
+    "Mystical Tutor": (CardTag.TUTOR, CardTag.INSTANT),
+    "Enlightened Tutor": (CardTag.TUTOR, CardTag.INSTANT),
 }
 
 
-def assign_tags(card_name: str, type_line: str, oracle_text: str) -> list[str]:
+# Precompiled oracle-text patterns (assign_tags runs for every fetched card).
+# Each tag gets its own search so it stops at the first hit; fixed phrases use
+# plain substring checks instead. All patterns are lowercase and run on the
+# pre-lowercased text, so none of them need re.IGNORECASE.
+_ADD_MANA_RE = re.compile(r"add\s+.*\{.*\}|add\s+(?:one|two|three|any)\s+mana")
+_DRAW_RE = re.compile(r"draw (?:a card|cards|\d+ cards?|two cards?|three cards?|four cards?)")
+_ENTERS_TAPPED_RE = re.compile(r"enters?\s+(?:the\s+battlefield\s+)?tapped")
+
+# Removal: a removal verb plus something it applies to
+_REMOVAL_VERBS = ("destroy", "exile", "sacrifice")
+_REMOVAL_OBJECTS = ("creature", "permanent", "target")
+
+# CardType bit -> tag (type lines are parsed by models.card_type_mask)
+_TYPE_TAGS: tuple[tuple[int, str], ...] = (
+    (CardType.LAND, CardTag.LAND),
+    (CardType.ARTIFACT, CardTag.ARTIFACT),
+    (CardType.CREATURE, CardTag.CREATURE),
+    (CardType.ENCHANTMENT, CardTag.ENCHANTMENT),
+    (CardType.INSTANT, CardTag.INSTANT),
+    (CardType.SORCERY, CardTag.SORCERY),
+    (CardType.PLANESWALKER, CardTag.PLANESWALKER),
+)
+
+# Land-specific conditionals for untapped entry
+_COND_BASICS_RE = re.compile(r"unless you control (two or more|2 or more) basic lands")
+_COND_BASIC_TYPE_RE = re.compile(r"unless you control (a|an) (plains|island|swamp|mountain|forest)")
+_COND_PAY_REVEAL_RE = re.compile(r"(unless you (pay|reveal)|as .*(this\s+)?(land\s+)?enters.* you may (pay|reveal))")
+_COND_FASTLAND_RE = re.compile(r"unless you control (two|2) or fewer other lands")
+_COND_CHECKLAND_COUNT_RE = re.compile(r"unless you control (three|3) or more other .*(mountains|islands|plains|swamps|forests)")
+_COND_OPPONENT_LANDS_RE = re.compile(r"unless an opponent (has|controls) more lands")
+_COND_CONTROL_THREE_RE = re.compile(r"enters.*tapped.*if you control (three|3) or more")
+
+
+@lru_cache(maxsize=1024)
+def _derive_from_type(type_line: str) -> frozenset[str]:
     """
-    Assign functional tags to a card based on name, type, and oracle text.
+    Card type tags from the type line.
+    
+    Built from the same bitmask as Card.type_mask, so the LAND tag always
+    agrees with Card.is_land. Memoized: type lines repeat heavily ("Basic
+    Land — Forest" appears dozens of times in a typical deck).
+    """
+    mask = card_type_mask(type_line)
+    return frozenset(tag for bit, tag in _TYPE_TAGS if mask & bit)
+
+
+def _derive_from_oracle(oracle_lower: str, is_land: bool) -> set[str]:
+    """
+    Functional tags from oracle text.
     
     Args:
-        card_name: Card name
-        type_line: Card type (e.g., "Creature — Human Wizard")
-        oracle_text: Card's rules text
+        oracle_lower: Lowercased rules text (every check below runs on this view)
+        is_land: Whether the card is a land
     
     Returns:
-        List of tag strings
+        Set of tag strings
     """
     tags: set[str] = set()
     
-    # 1. Check static mappings first
-    if card_name in STATIC_CARD_TAGS:
-        tags.update(STATIC_CARD_TAGS[card_name])
-    
-    # 2. Automatic land detection
-    if "Land" in type_line:
-        tags.add(CardTag.LAND)
-    
-    # 3. Add card type tags
-    if "Artifact" in type_line:
-        tags.add(CardTag.ARTIFACT)
-    if "Creature" in type_line:
-        tags.add(CardTag.CREATURE)
-    if "Enchantment" in type_line:
-        tags.add(CardTag.ENCHANTMENT)
-    if "Instant" in type_line:
-        tags.add(CardTag.INSTANT)
-    if "Sorcery" in type_line:
-        tags.add(CardTag.SORCERY)
-    if "Planeswalker" in type_line:
-        tags.add(CardTag.PLANESWALKER)
-    
-    # 4. Rule-based tagging from oracle text
-    oracle_lower = oracle_text.lower()
-    
     # Ramp detection
     # Generic Ramp (includes Fetch Ramp)
     if "search your library for a" in oracle_lower and "land" in oracle_lower:
@@ -170,21 +198,21 @@ def assign_tags(card_name: str, type_line: str, oracle_text: str) -> list[str]:
     # Valid: "{T}: Add {R}", "Add one mana", "Add three mana"
     # Invalid: "Add a Counter"
     # CRITICAL: Exclude Lands, as they are handled separately and we don't want double counting in stats
-    if "Land" not in type_line and re.search(r"add\s+.*(\{.*\})|add\s+(one|two|three|any)\s+mana", oracle_lower):
+    if not is_land and _ADD_MANA_RE.search(oracle_lower):
         tags.add(CardTag.MANA_ROCK)
         tags.add(CardTag.RAMP) # All rocks are ramp
     
     # Draw detection
-    if re.search(r"draw (a card|cards|\d+ cards?|two cards?|three cards?|four cards?)", oracle_lower):
+    if _DRAW_RE.search(oracle_lower):
         tags.add(CardTag.DRAW)
     
     # Removal detection
-    if any(word in oracle_lower for word in ["destroy", "exile", "sacrifice"]):
-        if any(target in oracle_lower for target in ["creature", "permanent", "target"]):
+    if any(word in oracle_lower for word in _REMOVAL_VERBS):
+        if any(target in oracle_lower for target in _REMOVAL_OBJECTS):
             tags.add(CardTag.REMOVAL)
     
     # Board wipe detection
-    if re.search(r"destroy all (creatures|permanents)", oracle_lower):
+    if "destroy all creatures" in oracle_lower or "destroy all permanents" in oracle_lower:
         tags.add(CardTag.BOARD_WIPE)
     
     # Counterspell detection
@@ -192,18 +220,18 @@ def assign_tags(card_name: str, type_line: str, oracle_text: str) -> list[str]:
         tags.add(CardTag.COUNTERSPELL)
     
     # Tutor detection
-    if re.search(r"search your library for a card", oracle_text, re.IGNORECASE):
+    if "search your library for a card" in oracle_lower:
         tags.add(CardTag.TUTOR)
     
     # Tapped entry detection (Global - for Lands AND Artifacts)
     # Check for "enters tapped" pattern (various formats)
     # "enters the battlefield tapped" OR "this land enters tapped" OR just "enters tapped" OR "this artifact enters tapped"
-    if re.search(r"(this\s+(land|artifact)\s+)?(enters?|enter)\s+(the\s+battlefield\s+)?tapped", oracle_text, re.IGNORECASE):
+    if _ENTERS_TAPPED_RE.search(oracle_lower):
         tags.add(CardTag.TAPPED_ENTRY)
 
     # Fetch Land Detection (Evolving Wilds, Brokers Hideout, etc.)
     # Must be Land. Must "Search library". Must "Sacrifice".
-    if "Land" in type_line and "search your library" in oracle_lower and "sacrifice" in oracle_lower:
+    if is_land and "search your library" in oracle_lower and "sacrifice" in oracle_lower:
         # Avoid tagging Ramp spells as Fetch Lands (already filtered by Land type check above)
         tags.add(CardTag.FETCH_LAND)
 
@@ -215,61 +243,105 @@ def assign_tags(card_name: str, type_line: str, oracle_text: str) -> list[str]:
     # Ramp Spell (Fetch-to-Battlefield) Detection
     # Logic: Search library + put onto battlefield. 
     # Must NOT be a Land (that's FETCH_LAND).
-    if "Land" not in type_line and "search your library" in oracle_lower and "put" in oracle_lower and "onto the battlefield" in oracle_lower:
+    if not is_land and "search your library" in oracle_lower and "put" in oracle_lower and "onto the battlefield" in oracle_lower:
         tags.add(CardTag.RAMP_FETCH)
+    
+    return tags
 
 
+def _apply_land_conditionals(tags: set[str], oracle_lower: str):
+    """
+    Resolve conditional tapped entry for lands (updates tags in place).
+    
+    Args:
+        tags: Tags assigned so far
+        oracle_lower: Lowercased rules text
+    """
+    if CardTag.TAPPED_ENTRY not in tags:
+        return
+    
+    # Check for common conditionals that allow it to enter untapped
+    # Pattern: "enters tapped unless X" or "enters tapped. X: enter untapped"
+    
+    # 1. Unless you control 2+ basic lands (most common: dual lands, shock lands)
+    if _COND_BASICS_RE.search(oracle_lower):
+        # Conservatively assume untapped (most decks have basics by turn 2-3)
+        tags.remove(CardTag.TAPPED_ENTRY)
+    
+    # 2. Unless you control Plains/Island/etc (check lands)
+    elif _COND_BASIC_TYPE_RE.search(oracle_lower):
+        # Conservatively assume you have it (remove tapped tag)
+        tags.remove(CardTag.TAPPED_ENTRY)
+    
+    # 3. Unless you reveal/pay life (shock lands, reveal lands)
+    # Handle comma: "enters, you may"
+    elif _COND_PAY_REVEAL_RE.search(oracle_lower):
+        # Assume you pay the cost (common in competitive play)
+        tags.remove(CardTag.TAPPED_ENTRY)
+    
+    # 4. Fastlands: Unless you control two or fewer other lands
+    # "enters tapped unless you control two or fewer other lands"
+    elif _COND_FASTLAND_RE.search(oracle_lower):
+        # Keep TAPPED_ENTRY but add condition tag for engine to check
+        tags.add("COND_FASTLAND")
 
+    # 5. Checklands with count: "unless you control 3 or more Mountains" (e.g. Dwarven Mine)
+    # Regex to capture the land type (plural)
+    elif match := _COND_CHECKLAND_COUNT_RE.search(oracle_lower):
+        # Valid basic land types
+        land_type = match.group(2).upper() # MOUNTAINS, ISLANDS, etc.
+        # Remove 'S' from plural to get singular type usually used in type line (MOUNTAIN)
+        # But Card.type_line usually has "Mountain", so "MOUNTAIN" is good.
+        # Our type check is simple string matching.
+        # Tag format: COND_COUNT_3_MOUNTAIN
+        tags.add(sys.intern(f"COND_COUNT_3_{land_type[:-1]}")) # MOUNTAIN
 
-    # Land-Specific Conditional Logic
-    if "Land" in type_line:
-        if CardTag.TAPPED_ENTRY in tags:
-            # Check for common conditionals that allow it to enter untapped
-            # Pattern: "enters tapped unless X" or "enters tapped. X: enter untapped"
-            
-            # 1. Unless you control 2+ basic lands (most common: dual lands, shock lands)
-            if re.search(r"unless you control (two or more|2 or more) basic lands", oracle_lower):
-                # Conservatively assume untapped (most decks have basics by turn 2-3)
-                tags.remove(CardTag.TAPPED_ENTRY)
-            
-            # 2. Unless you control Plains/Island/etc (check lands)
-            elif re.search(r"unless you control (a|an) (plains|island|swamp|mountain|forest)", oracle_lower):
-                # Conservatively assume you have it (remove tapped tag)
-                tags.remove(CardTag.TAPPED_ENTRY)
-            
-            # 3. Unless you reveal/pay life (shock lands, reveal lands)
-            # Handle comma: "enters, you may"
-            elif re.search(r"(unless you (pay|reveal)|as .*(this\s+)?(land\s+)?enters.* you may (pay|reveal))", oracle_lower):
-                # Assume you pay the cost (common in competitive play)
-                tags.remove(CardTag.TAPPED_ENTRY)
-            
-            # 4. Fastlands: Unless you control two or fewer other lands
-            # "enters tapped unless you control two or fewer other lands"
-            elif re.search(r"unless you control (two|2) or fewer other lands", oracle_lower):
-                # Keep TAPPED_ENTRY but add condition tag for engine to check
-                tags.add("COND_FASTLAND")
+    # 6. If opponent has more lands than you
+    elif _COND_OPPONENT_LANDS_RE.search(oracle_lower):
+        # Conservatively assume it enters tapped (keep tag)
+        pass
+    
+    # 5. Enters tapped if you control X or more lands
+    elif _COND_CONTROL_THREE_RE.search(oracle_lower):
+        # Conservatively assume it enters untapped early game
+        tags.remove(CardTag.TAPPED_ENTRY)
+    
+    # Default: If "enters tapped" with no recognized conditional, keep TAPPED_ENTRY tag
 
-            # 5. Checklands with count: "unless you control 3 or more Mountains" (e.g. Dwarven Mine)
-            # Regex to capture the land type (plural)
-            elif match := re.search(r"unless you control (three|3) or more other .*(mountains|islands|plains|swamps|forests)", oracle_lower):
-                # Valid basic land types
-                land_type = match.group(2).upper() # MOUNTAINS, ISLANDS, etc.
-                # Remove 'S' from plural to get singular type usually used in type line (MOUNTAIN)
-                # But Card.type_line usually has "Mountain", so "MOUNTAIN" is good.
-                # Our type check is simple string matching.
-                # Tag format: COND_COUNT_3_MOUNTAIN
-                tags.add(f"COND_COUNT_3_{land_type[:-1]}") # MOUNTAIN
 
-            # 6. If opponent has more lands than you
-            elif re.search(r"unless an opponent (has|controls) more lands", oracle_lower):
-                # Conservatively assume it enters tapped (keep tag)
-                pass
-            
-            # 5. Enters tapped if you control X or more lands
-            elif re.search(r"enters.*tapped.*if you control (three|3) or more", oracle_lower):
-                # Conservatively assume it enters untapped early game
-                tags.remove(CardTag.TAPPED_ENTRY)
-            
-            # Default: If "enters tapped" with no recognized conditional, keep TAPPED_ENTRY tag
+def assign_tags(card_name: str, type_line: str, oracle_text: str) -> list[str]:
+    """
+    Assign functional tags to a card based on name, type, and oracle text.
+    
+    Args:
+        card_name: Card name
+        type_line: Card type (e.g., "Creature — Human Wizard")
+        oracle_text: Card's rules text
+    
+    Returns:
+        List of tag strings
+    """
+    tags: set[str] = set()
+    
+    # 1. Check static mappings first
+    static_tags = STATIC_CARD_TAGS.get(card_name)
+    if static_tags:
+        tags.update(static_tags)
+    
+    # 2./3. Land detection and card type tags
+    type_tags = _derive_from_type(type_line)
+    tags.update(type_tags)
+    is_land = CardTag.LAND in type_tags
+    
+    # 4. Rule-based tagging from oracle text
+    # Skipped for known non-land cards: their static entry already lists their
+    # functional tags. Lands still need the tapped-entry analysis.
+    if static_tags is None or is_land:
+        oracle_lower = oracle_text.lower()
+        tags.update(_derive_from_oracle(oracle_lower, is_land))
+        
+        # Land-Specific Conditional Logic
+        if is_land:
+            _apply_land_conditionals(tags, oracle_lower)
     
     return list(tags)
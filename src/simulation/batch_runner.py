@@ -21,7 +21,7 @@ def _run_single_simulation(args):
     
     # Create FRESH copies for this game (Multiprocessing might serialize copies, but to be safe)
     # Actually multiprocessing pickles the args. 
-    # But Card is a Pydantic model. Pickling should work.
+    # Card is a plain dataclass. Pickling should work.
     
     # We need to construct the deck instances inside the process if we want to be 100% safe
     # OR we assume the list passed in is deep copied by pickle during fork.
@@ -42,10 +42,8 @@ def _run_single_simulation(args):
     # But `engine.start_game` needs `Card` objects.
     # Let's try passing the objects. 100 cards is small enough.
     
-    # Explicitly model_copy just in case
-    game_deck = [c.model_copy(deep=True) for c in deck]
-    
-    engine.start_game(game_deck, commander=commander)
+    # start_game creates fresh Card instances per game
+    engine.start_game(deck, commander=commander)
     result = engine.run_simulation(turns=turns)
     return result
 
@@ -127,6 +125,7 @@ class BatchRunner:
 if __name__ == "__main__":
     import argparse
     import asyncio
+    import logging
     from core.scryfall import fetch_deck_from_decklist
     
     async def main():
@@ -138,6 +137,9 @@ if __name__ == "__main__":
         
         args = parser.parse_args()
         
+        # Show deck-loading progress/warnings from core.scryfall
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        
         if not os.path.exists(args.deck):
             print(f"❌ Deck file not found: {args.deck}")
             return
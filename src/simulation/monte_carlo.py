@@ -1,6 +1,7 @@
 
 import argparse
 import asyncio
+import logging
 import os
 import sys
 import time
@@ -19,12 +20,8 @@ async def run_simulation(deck_lines: list[str], commander_name: str, num_sims: i
     print("   Fetching deck...")
     
     # Fetch deck ONCE to save API calls
-    # Note: We must deep copy this deck for each game! 
-    # Current engine.start_game modifies the deck list in place?
-    # Engine.start_game takes a list of Cards.
-    # Our scryfall fetcher returns NEW instances now (model_copy).
-    # But for 1000 sims, we should not fetch 1000 times.
-    # We fetch once, then deep copy for each sim.
+    # Duplicates in the fetched deck share Card instances;
+    # engine.start_game copies them into fresh instances for each sim.
     
     base_deck, cmdr = await fetch_deck_from_decklist(deck_lines, commander_name)
     print(f"   Deck loaded: {len(base_deck)} cards. Commander: {cmdr}")
@@ -43,12 +40,9 @@ async def run_simulation(deck_lines: list[str], commander_name: str, num_sims: i
         if i % 100 == 0:
             print(f"   Simulating game {i}...")
             
-        # Create FRESH copies for this game
-        # Card is Pydantic model, use model_copy(deep=True)
-        game_deck = [c.model_copy(deep=True) for c in base_deck]
-        
+        # start_game creates FRESH card instances for this game
         engine = GameEngine(verbose=False) # Silent mode
-        engine.start_game(game_deck, commander_name=cmdr)
+        engine.start_game(base_deck, commander_name=cmdr)
         
         # Run turns
         for t in range(1, turns + 1):
@@ -100,6 +94,9 @@ if __name__ == "__main__":
     parser.add_argument("--deck", type=str, default="data/sample_decklist.txt", help="Deck file")
     args = parser.parse_args()
     
+    # Show deck-loading progress/warnings from core.scryfall
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     with open(args.deck, "r") as f:
         lines = f.readlines()
     
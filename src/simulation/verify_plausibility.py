@@ -1,5 +1,6 @@
 
 import asyncio
+import logging
 import math
 import os
 import sys
@@ -129,4 +130,5 @@ async def main():
     print(f"\n   Note: This confirms that the engine isn't 'cheating' land drops.")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -9,6 +9,7 @@ This script demonstrates the core functionality of Phase 1:
 """
 
 import asyncio
+import logging
 import sys
 from pathlib import Path
 
@@ -146,4 +147,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Show deck summary, cache stats and warnings from core.scryfall
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -5,6 +5,7 @@ Loads a deck, runs 10 turns, and outputs statistics.
 """
 
 import asyncio
+import logging
 import sys
 from pathlib import Path
 
@@ -186,4 +187,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
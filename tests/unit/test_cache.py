@@ -0,0 +1,54 @@
+"""Unit tests for the Scryfall file cache."""
+
+import pytest
+from src.core.cache import ScryfallCache
+
+
+SOL_RING = {"name": "Sol Ring", "mana_cost": "{1}", "type_line": "Artifact"}
+FOREST = {"name": "Forest", "mana_cost": "", "type_line": "Basic Land — Forest"}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty cache in a temporary directory."""
+    return ScryfallCache(cache_dir=str(tmp_path / "cache"))
+
+
+def test_get_many_hit_and_miss(cache):
+    """Test that get_many returns only the cached cards."""
+    cache.put("Sol Ring", SOL_RING)
+    
+    result = cache.get_many(["Sol Ring", "Forest"])
+    
+    assert result == {"Sol Ring": SOL_RING}
+
+
+def test_get_many_expired_is_miss(cache):
+    """Test that expired entries are misses and clear_expired purges them."""
+    cache.put("Sol Ring", SOL_RING)
+    cache.index["sol_ring"]["timestamp"] -= cache.ttl_seconds + 1
+    
+    assert cache.get_many(["Sol Ring"]) == {}
+    
+    assert cache.clear_expired() == 1
+    assert "sol_ring" not in cache.index
+    assert not (cache.cache_dir / "sol_ring.json").exists()
+
+
+def test_get_many_unreadable_file(cache):
+    """Test that a corrupt cache file is treated as a miss."""
+    cache.put("Sol Ring", SOL_RING)
+    (cache.cache_dir / "sol_ring.json").write_text("{not json")
+    
+    assert cache.get_many(["Sol Ring"]) == {}
+
+
+def test_put_many_round_trip(cache):
+    """Test that put_many writes cards and an index a new cache can read."""
+    cache.put_many({"Sol Ring": SOL_RING, "Forest": FOREST})
+    
+    reloaded = ScryfallCache(cache_dir=str(cache.cache_dir))
+    
+    assert reloaded.get_many(["Sol Ring", "Forest"]) == {"Sol Ring": SOL_RING, "Forest": FOREST}
+    # Atomic writes leave no temp files behind
+    assert not list(cache.cache_dir.glob("*.tmp"))
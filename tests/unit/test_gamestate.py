@@ -2,7 +2,7 @@
 
 import pytest
 from src.core.models import Card
-from src.core.engine import GameState
+from src.core.engine import GameState, GameEngine
 
 
 def create_test_card(name: str, cmc: int, is_land: bool = False) -> Card:
@@ -182,3 +182,17 @@ def test_get_total_mana():
     
     state.mana_pool = {"colorless": 3, "R": 2}
     assert state.get_total_mana() == 5
+
+
+def test_start_game_creates_fresh_instances():
+    """Test that shared deck instances become distinct per-game cards."""
+    forest = create_test_card("Forest", 0, is_land=True)
+    deck = [forest] * 10
+    
+    engine = GameEngine(verbose=False)
+    engine.start_game(deck)
+    
+    in_game = engine.state.library + engine.state.hand
+    assert len(in_game) == 10
+    assert len({id(c) for c in in_game}) == 10
+    assert all(c is not forest for c in in_game)
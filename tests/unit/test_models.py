@@ -1,7 +1,7 @@
 """Unit tests for Card and Deck models."""
 
 import pytest
-from src.core.models import Card, Deck
+from src.core.models import Card, CardType, Deck
 
 
 def test_card_creation():
@@ -39,6 +39,57 @@ def test_card_is_land():
     assert land.is_land == True
 
 
+def test_card_type_mask():
+    """Test type bitmask and derived permanent check."""
+    creature = Card(
+        name="Steel Overseer",
+        mana_cost={"colorless": 2},
+        cmc=2,
+        type_line="Artifact Creature — Construct",
+        oracle_text="",
+        tags=[],
+        scryfall_id="test-id-789",
+        color_identity=[],
+    )
+    sorcery = Card(
+        name="Cultivate",
+        mana_cost={"colorless": 2, "G": 1},
+        cmc=3,
+        type_line="Sorcery",
+        oracle_text="",
+        tags=[],
+        scryfall_id="test-id-790",
+        color_identity=["G"],
+    )
+    
+    assert creature.type_mask == CardType.ARTIFACT | CardType.CREATURE
+    assert creature.is_permanent
+    assert not creature.is_land
+    assert sorcery.type_mask == CardType.SORCERY
+    assert not sorcery.is_permanent
+
+
+def test_card_copy_is_independent():
+    """Test that copies don't share mutable state with the original."""
+    card = Card(
+        name="Forest",
+        mana_cost={},
+        cmc=0,
+        type_line="Basic Land — Forest",
+        oracle_text="Tap: Add G.",
+        tags=["LAND"],
+        scryfall_id="test-id-456",
+        color_identity=["G"],
+    )
+    
+    clone = card.copy()
+    clone.tags.append("TAPPED_ENTRY")
+    
+    assert clone is not card
+    assert clone.name == card.name
+    assert card.tags == ["LAND"]
+
+
 def test_deck_validation():
     """Test deck validation (99 cards + commander)."""
     commander = Card(
@@ -69,6 +120,9 @@ def test_deck_validation():
     deck = Deck(commander=commander, cards=cards)
     
     assert len(deck.all_cards) == 100
+    assert list(deck.iter_cards()) == deck.all_cards
+    # Stored as a tuple so the cached aggregates can't go stale
+    assert isinstance(deck.cards, tuple)
     assert deck.commander.name == "Atraxa, Praetors' Voice"
 
 
@@ -195,3 +249,40 @@ def test_deck_avg_cmc():
     
     # Average should be: (commander=5 + 16*1 + 16*2 + 16*3 + 16*4) / (1+64) = 165/65 = 2.54
     assert 2.0 <= deck.avg_cmc <= 3.0
+
+
+def test_deck_tag_distribution():
+    """Test tag distribution counts across commander and deck."""
+    commander = Card(
+        name="Commander",
+        mana_cost={},
+        cmc=0,
+        type_line="Legendary Creature",
+        oracle_text="",
+        tags=["CREATURE"],
+        scryfall_id="cmd",
+        color_identity=[],
+    )
+    
+    cards = [
+        Card(
+            name=f"Land {i}",
+            mana_cost={},
+            cmc=0,
+            type_line="Land",
+            oracle_text="",
+            tags=["LAND", "RAMP"] if i < 10 else ["LAND"],
+            scryfall_id=f"land-{i}",
+            color_identity=[],
+        )
+        for i in range(99)
+    ]
+    
+    deck = Deck(commander=commander, cards=cards)
+    distribution = deck.get_tag_distribution()
+    
+    assert distribution == {"CREATURE": 1, "LAND": 99, "RAMP": 10}
+    
+    # Returned dict is a copy; mutating it must not affect the deck
+    distribution["LAND"] = 0
+    assert deck.get_tag_distribution()["LAND"] == 99
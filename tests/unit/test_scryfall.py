@@ -1,7 +1,13 @@
 """Unit tests for Scryfall client with rate limiting and format parsing."""
 
+import json
+
+import httpx
 import pytest
+from src.core import scryfall
 from src.core.scryfall import (
+    _match_collection_results,
+    fetch_cards,
     parse_card_name,
     parse_mana_cost,
 )
@@ -66,6 +72,12 @@ def test_parse_mana_cost_phyrexian():
     assert result["R"] == 2
 
 
+def test_parse_mana_cost_hybrid_phyrexian_counts_first_color():
+    """Test that a hybrid Phyrexian symbol like {G/U/P} counts as its first color."""
+    result = parse_mana_cost("{1}{G/U/P}")
+    assert result == {"colorless": 1, "G": 1}
+
+
 def test_parse_mana_cost_x_spell():
     """Test parsing X spells."""
     result = parse_mana_cost("{X}{U}{U}")
@@ -83,3 +95,72 @@ def test_parse_mana_cost_complex():
     """Test parsing complex mana cost."""
     result = parse_mana_cost("{3}{W}{U}{B}")
     assert result == {"colorless": 3, "W": 1, "U": 1, "B": 1}
+
+
+def test_match_collection_results_case_insensitive():
+    """Test that collection results match requested names case-insensitively."""
+    found = [{"name": "Sol Ring"}, {"name": "Command Tower"}]
+    
+    result = _match_collection_results(["sol ring", "COMMAND TOWER"], found)
+    
+    assert result == {"sol ring": found[0], "COMMAND TOWER": found[1]}
+
+
+def test_match_collection_results_double_faced():
+    """Test that double-faced cards match by full name and by front face."""
+    delver = {"name": "Delver of Secrets // Insectile Aberration"}
+    
+    result = _match_collection_results(
+        ["Delver of Secrets", "Delver of Secrets // Insectile Aberration"], [delver]
+    )
+    
+    assert result == {
+        "Delver of Secrets": delver,
+        "Delver of Secrets // Insectile Aberration": delver,
+    }
+
+
+def test_match_collection_results_missing():
+    """Test that names without a result are left out."""
+    result = _match_collection_results(["Sol Ring", "Nonexistent Card"], [{"name": "Sol Ring"}])
+    
+    assert list(result) == ["Sol Ring"]
+
+
+async def test_fetch_cards_fuzzy_fallback(monkeypatch):
+    """Test that names the collection endpoint can't match fall back to fuzzy search."""
+    card_db = {
+        "sol ring": {"name": "Sol Ring", "mana_cost": "{1}", "cmc": 1,
+                     "type_line": "Artifact", "oracle_text": "{T}: Add {C}{C}."},
+        "lightning bolt": {"name": "Lightning Bolt", "mana_cost": "{R}", "cmc": 1,
+                           "type_line": "Instant", "oracle_text": "Lightning Bolt deals 3 damage to any target."},
+    }
+    fuzzy_queries = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/cards/collection":
+            identifiers = json.loads(request.content)["identifiers"]
+            data = [card_db[i["name"].lower()] for i in identifiers if i["name"].lower() in card_db]
+            not_found = [i for i in identifiers if i["name"].lower() not in card_db]
+            return httpx.Response(200, json={"object": "list", "data": data, "not_found": not_found})
+        
+        query = request.url.params["fuzzy"]
+        fuzzy_queries.append(query)
+        if query == "Lightning Blot":
+            return httpx.Response(200, json=card_db["lightning bolt"])
+        return httpx.Response(404, json={"object": "error"})
+    
+    real_client = httpx.AsyncClient
+    
+    def mock_client(**kwargs):
+        kwargs.pop("limits", None)
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+    
+    monkeypatch.setattr(scryfall.httpx, "AsyncClient", mock_client)
+    monkeypatch.setattr(scryfall, "RATE_LIMIT_DELAY", 0)
+    
+    cards = await fetch_cards(["1 Sol Ring", "Lightning Blot", "Nonexistent Card"], use_cache=False)
+    
+    assert [card.name for card in cards] == ["Sol Ring", "Lightning Bolt"]
+    # Only the names missing from the collection response hit the fuzzy endpoint
+    assert sorted(fuzzy_queries) == ["Lightning Blot", "Nonexistent Card"]
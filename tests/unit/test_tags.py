@@ -1,6 +1,7 @@
 """Unit tests for tagging system."""
 
 import pytest
+from src.core.models import Card, CardType
 from src.core.tags import assign_tags, CardTag, STATIC_CARD_TAGS
 
 
@@ -141,3 +142,54 @@ def test_static_mappings_complete():
     assert "Swords to Plowshares" in STATIC_CARD_TAGS
     assert "Counterspell" in STATIC_CARD_TAGS
     assert "Demonic Tutor" in STATIC_CARD_TAGS
+
+
+def test_overlapping_oracle_patterns():
+    """Test that one oracle pattern match doesn't hide another on the same line."""
+    tags = assign_tags(
+        "Custom Mana Draw",
+        "Artifact",
+        "{T}: Add {G}. Draw a card, then add {G} again."
+    )
+    
+    assert CardTag.MANA_ROCK in tags
+    assert CardTag.DRAW in tags
+
+
+def test_static_card_skips_oracle_rules():
+    """Test that static non-land entries aren't re-derived from oracle text."""
+    # "add an amount of {C}" matches the mana-rock rule, which would tag this
+    # counterspell as MANA_ROCK/RAMP if the oracle rules ran
+    tags = assign_tags(
+        "Mana Drain",
+        "Instant",
+        "Counter target spell. At the beginning of your next main phase, "
+        "add an amount of {C} equal to that spell's mana value."
+    )
+    
+    assert sorted(tags) == [CardTag.COUNTERSPELL, CardTag.INSTANT]
+
+
+def test_type_tags_match_card_type_mask():
+    """Test that type tags come from the same type-line parse as Card.type_mask."""
+    for type_line in ("Artifact Land", "Land Creature — Forest Dryad",
+                      "Legendary Enchantment Artifact", "Kindred Sorcery — Elf"):
+        card = Card(name="Test", cmc=0, type_line=type_line, scryfall_id="test-id")
+        tags = assign_tags("Test", type_line, "")
+        
+        assert (CardTag.LAND in tags) == card.is_land
+        assert (CardTag.ARTIFACT in tags) == bool(card.type_mask & CardType.ARTIFACT)
+
+
+def test_land_conditionals_checked_in_order():
+    """Test that earlier land conditionals win over later ones in the same text."""
+    tags = assign_tags(
+        "Custom Land",
+        "Land",
+        "This land enters tapped unless an opponent controls more lands than you. "
+        "If you control three or more other lands, scry 1."
+    )
+    
+    # "unless an opponent controls more lands" keeps it tapped, even though
+    # "enters ... tapped ... if you control three or more" matches further left
+    assert CardTag.TAPPED_ENTRY in tags